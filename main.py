@@ -9,7 +9,8 @@ on the Ethiopian calendar only.
 """
 
 from dataclasses import dataclass
-import math
+from functools import lru_cache
+from types import MappingProxyType
 
 # --- Definitions of Ethiopian months ---
 MONTHS = [
@@ -21,7 +22,27 @@ EVANGELISTS = ["John", "Matthew", "Mark", "Luke"]
 DAYSFORJOHN = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 ADDON = [6, 5, 4, 3, 2, 8, 7]  # Correspond à l'ajout pour Mebega Hemere selon le jour
 
-@dataclass
+# Cumulative number of days before each month (index 13 is the year length)
+CUM_MONTH_DAYS_COMMON = (0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330, 360, 365)
+CUM_MONTH_DAYS_LEAP = (0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330, 360, 366)
+
+# List of festivals and fasts with their offset in days from Nineveh
+_OFFSETS: tuple[tuple[str, int], ...] = (
+    ('Great Lent', 14),
+    ('Mt Olivier', 41),
+    ('Hosanna', 62),
+    ('Crucifixion', 67),
+    ('Resurrection', 69),
+    ('Synod', 93),
+    ('Ascension', 108),
+    ('Pentecost', 118),
+    ('Fast of Holy Apostles', 119),
+    ('Salvation Fast', 121),
+)
+_OFFSET_NAMES = tuple(name for name, _ in _OFFSETS)
+_OFFSET_DAYS = tuple(days for _, days in _OFFSETS)
+
+@dataclass(slots=True, frozen=True)
 class EthioDate:
     year: int
     month: int
@@ -36,75 +57,91 @@ def is_ethio_leap(year: int) -> bool:
     return (year % 4) == 3
 
 
-def month_length(month: int, year: int) -> int:
-    if 1 <= month <= 12:
-        return 30
-    elif month == 13:
-        return 6 if is_ethio_leap(year) else 5
-    else:
-        raise ValueError("Invalid month (1-13 expected)")
+def leap_days(year: int) -> int:
+    """Number of leap days (extra Pagumén days) before the given year."""
+    return year // 4
+
+
+def to_ordinal(date: EthioDate) -> int:
+    """Converts an Ethiopian date to an absolute day count."""
+    # Month starts are the same in common and leap years
+    year = date.year
+    return year * 365 + leap_days(year) + CUM_MONTH_DAYS_COMMON[date.month - 1] + (date.day - 1)
+
+
+def from_ordinal(n: int) -> EthioDate:
+    """Converts an absolute day count back to an Ethiopian date."""
+    # Years come in cycles of 1461 days, the leap year being the last one
+    cycle, rest = divmod(n, 1461)
+    year_in_cycle = min(rest // 365, 3)
+    day_of_year = rest - year_in_cycle * 365
+    # Pagumén falls out of the divmod as month index 12
+    month_index, day_index = divmod(day_of_year, 30)
+    return EthioDate(cycle * 4 + year_in_cycle, month_index + 1, day_index + 1)
 
 
 def add_days(date: EthioDate, days: int) -> EthioDate:
-    year, month, day = date.year, date.month, date.day
-    if days >= 0:
-        while days > 0:
-            ml = month_length(month, year)
-            if day + days <= ml:
-                day += days
-                days = 0
-            else:
-                days -= (ml - day + 1)
-                day = 1
-                month += 1
-                if month > 13:
-                    month = 1
-                    year += 1
-    return EthioDate(year, month, day)
+    return from_ordinal(to_ordinal(date) + days)
+
+
+def add_days_bulk(date: EthioDate, offsets):
+    """Yields the dates obtained by adding each offset (in days) to a date."""
+    base = to_ordinal(date)
+    for days in offsets:
+        yield from_ordinal(base + days)
 
 
 def add_months(date: EthioDate, months: int) -> EthioDate:
     total_months = (date.month - 1) + months
     new_year = date.year + total_months // 13
     new_month = (total_months % 13) + 1
-    new_day = min(date.day, month_length(new_month, new_year))
+    cum = CUM_MONTH_DAYS_LEAP if is_ethio_leap(new_year) else CUM_MONTH_DAYS_COMMON
+    new_day = min(date.day, cum[new_month] - cum[new_month - 1])
     return EthioDate(new_year, new_month, new_day)
 
 
-def compute_fasts_and_feasts(year: int):
-    """Calculates all feasts and fasts from a given Ethiopian year."""
+def _compute_core(year: int):
+    """Computes the integer quantities of the calendar for a given year.
+
+    Returns (yw, E, Mr, Jd, c, n, a, m, t_month, t_day, t_day_index).
+    """
     yw = 5500 + year
 
     # Get the last two digits of the year
     last_two_digits = year % 100
 
     #Use the last two digits for calculations
-    E = math.trunc(last_two_digits % 4)
-    Mr = math.trunc(yw / 4)
-    Jd = math.trunc((Mr + yw) % 7)
-    c = math.trunc(yw % 19)
-    c = 19 if c == 0 else c
+    E = last_two_digits % 4
+    Mr = yw // 4
+    Jd = (Mr + yw) % 7
+    c = ((yw - 1) % 19) + 1  # 1..19, a multiple of 19 gives 19
     n = c - 1
-    a = math.trunc((n * 11) % 30)
+    a = (n * 11) % 30
     m = 30 - a
 
     # Determination of the Feast of Trumpets
-    if m < 14:
-        t_month, t_day = 2, m  # Teqemt
-    else:
-        t_month, t_day = 1, m  # Mäskäräm
-
-    t_date = EthioDate(year, t_month, t_day)
+    # Teqemt (2) when m < 14, Mäskäräm (1) otherwise
+    t_month = 2 - int(m >= 14)
+    t_day = m
 
     #get day of week from t_date
     first_day_index = Jd
     if (t_month == 2):
         first_day_index = (first_day_index + 2) % 7
-    for i in range(t_day):
-        t_day_index = (first_day_index + i) % 7
+    t_day_index = (first_day_index + t_day - 1) % 7
+
+    return yw, E, Mr, Jd, c, n, a, m, t_month, t_day, t_day_index
+
+
+@lru_cache(maxsize=4096)
+def compute_fasts_and_feasts(year: int):
+    """Calculates all feasts and fasts from a given Ethiopian year.
 
-        
-        
+    Results are cached per year and returned as a read-only mapping.
+    """
+    yw, E, Mr, Jd, c, n, a, m, t_month, t_day, t_day_index = _compute_core(year)
+
+    t_date = EthioDate(year, t_month, t_day)
 
     # Mebega Hemere = feast of trumpets + addon
     h_date = add_days(t_date, ADDON[t_day_index])
@@ -112,34 +149,6 @@ def compute_fasts_and_feasts(year: int):
     # Nineveh = +4 months
     nineveh = add_months(h_date, 4)
 
-    # List of festivals and fasts according to offsets
-    offsets = {
-        'Great Lent': 14,
-        'Mt Olivier': 41,
-        'Hosanna': 62,
-        'Crucifixion': 67,
-        'Resurrection': 69,
-        'Synod': 93,
-        'Ascension': 108,
-        'Pentecost': 118,
-        'Fast of Holy Apostles': 119,
-        'Salvation Fast': 121
-    }
-
-    results = {
-        'Ethiopian Year': year,
-        'YW': yw,
-        'Evangelist (E)': str(E)+' '+str(EVANGELISTS[E]),
-        'Metene Rabeite (Mr)': Mr,
-        'Day of John (Jd)': str(Jd)+' '+str(DAYSFORJOHN[Jd]),
-        'Cycle (c)': c,
-        'Golden number (n)': n,
-        'Epact (a)': a,
-        'm': m,
-        'Beale Meteque (Feast of Trumpet)': str(t_date)+' '+str(DAYSFORJOHN[t_day_index]),
-        'Mebega Hemere (Ark’s dwelling place)': str(h_date)+' ADDON: '+str(ADDON[t_day_index]),
-        'Nineveh': nineveh
-    }
     results = {
         'Ethiopian Year': year,
         'YW': yw,
@@ -153,20 +162,29 @@ def compute_fasts_and_feasts(year: int):
         'Beale Meteque (Feast of Trumpet)': f"{t_date} {DAYSFORJOHN[t_day_index]}",
         'Mebega Hemere (Ark’s dwelling place)': f"{h_date} ADDON: {ADDON[t_day_index]}",
         'Nineveh': nineveh
-    }
+    } | dict(zip(_OFFSET_NAMES, add_days_bulk(nineveh, _OFFSET_DAYS)))
+
+    return MappingProxyType(results)
+
 
-    for name, offset in offsets.items():
-        results[name] = add_days(nineveh, offset)
+def compute_fasts_and_feasts_bulk(years):
+    """Calculates feasts and fasts for several Ethiopian years.
 
-    return results
+    Yields (year, results) pairs in the order of the given years.
+    """
+    for year in years:
+        yield year, compute_fasts_and_feasts(year)
 
 
 if __name__ == "__main__":
     import json
+    import sys
     yearStart = int(input("Enter the starting Ethiopian year: "))
     yearEnd = int(input("Enter the ending Ethiopian year:  "))
-    for year in range(yearStart, yearEnd + 1):
-        data = compute_fasts_and_feasts(year)
+    out = []
+    for year, data in compute_fasts_and_feasts_bulk(range(yearStart, yearEnd + 1)):
         printable = {k: str(v) for k, v in data.items()}
-        print(f"\n--- Year {year} ---")
-        print(json.dumps(printable, ensure_ascii=False, indent=2))
+        out.append(f"\n--- Year {year} ---\n")
+        out.append(json.dumps(printable, ensure_ascii=False, indent=2))
+        out.append("\n")
+    sys.stdout.write("".join(out))